@@ -1,149 +1,253 @@
-from typing import List, Optional
+import asyncio
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from bson import ObjectId
+from bson.errors import InvalidId
 from datetime import datetime
-from database.connection import get_collection
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+from database.connection import get_collection, NAME_COLLATION, LIST_INDEX_NAME
 from models.sentra_core import SentraCoreModel, SentraCoreCreate, SentraCoreUpdate
 
+# Fields needed by list views; labels and connections are left out
+LIST_PROJECTION = {
+    "name": 1,
+    "description": 1,
+    "selected_option": 1,
+    "created_at": 1,
+    "updated_at": 1
+}
+
+# How long (seconds) get-by-id requests wait to be coalesced into one query
+READ_BATCH_WINDOW = 0.002
+
+# List views are returned as plain dicts with a string _id
+LIST_PROJECT_STAGE = {"$project": {"_id": {"$toString": "$_id"}, **LIST_PROJECTION}}
+
+@lru_cache(maxsize=256)
+def _prefix_match(name: str) -> dict:
+    """Build (once per search term) the $match stage for a case-insensitive prefix search.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    # U+FFFF sorts after every character, so it closes the prefix range
+    return {"$match": {"name": {"$gte": name, "$lt": name + "\uffff"}}}
+
+def _parse_oid(value: str) -> ObjectId:
+    """Parse a hex string into an ObjectId, raising ValueError if it is malformed."""
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise ValueError("Invalid ObjectId format")
+
+def _from_doc(model_cls, doc: dict):
+    """Build a model from a stored document without re-validating it."""
+    doc["_id"] = str(doc["_id"])
+    return model_cls.model_construct(**doc)
+
 class SentraCoreController:
     def __init__(self):
         self.collection = get_collection("sentra_core")
+        # Futures for get-by-id requests waiting on the next batched read
+        self._pending_reads = {}
+        self._flush_task = None
 
     async def create_sentra_core(self, sentra_core_data: SentraCoreCreate) -> SentraCoreModel:
         """Create a new SentraCore configuration."""
+        # Convert to model with timestamps
+        sentra_core_model = SentraCoreModel(
+            name=sentra_core_data.name,
+            description=sentra_core_data.description,
+            labels=sentra_core_data.labels,
+            connections=sentra_core_data.connections,
+            selected_option=sentra_core_data.selected_option
+        )
+        
+        # Insert into database
+        result = await self.collection.insert_one(sentra_core_model.model_dump(by_alias=True))
+        
+        # The model already holds everything that was written
+        sentra_core_model.id = str(result.inserted_id)
+        return sentra_core_model
+
+    async def bulk_create(self, items: List[SentraCoreCreate]) -> Tuple[List[str], List[dict]]:
+        """Create many SentraCore configurations in one round-trip.
+
+        Returns the inserted IDs and, for documents that failed, their index and error message.
+        """
+        if not items:
+            return [], []
+        
+        now = datetime.utcnow()
+        # Items are already validated by the request body, so dump them as-is
+        docs = [{**item.model_dump(), "created_at": now, "updated_at": now} for item in items]
         try:
-            # Convert to model with timestamps
-            sentra_core_model = SentraCoreModel(
-                name=sentra_core_data.name,
-                description=sentra_core_data.description,
-                labels=sentra_core_data.labels,
-                connections=sentra_core_data.connections,
-                selected_option=sentra_core_data.selected_option
-            )
-            
-            # Insert into database
-            result = await self.collection.insert_one(sentra_core_model.model_dump(by_alias=True))
-            
-            # Get the created document
-            created_doc = await self.collection.find_one({"_id": result.inserted_id})
-            return SentraCoreModel(**created_doc)
-            
-        except Exception as e:
-            raise Exception(f"Error creating SentraCore configuration: {str(e)}")
+            result = await self.collection.insert_many(docs, ordered=False, bypass_document_validation=True)
+        except BulkWriteError as e:
+            # Unordered inserts carry on past failures, so report what was written
+            write_errors = e.details.get("writeErrors", [])
+            failed = {error["index"] for error in write_errors}
+            if e.details.get("nInserted") != len(docs) - len(failed):
+                raise
+            # insert_many assigned every document an _id before sending it
+            inserted_ids = [str(doc["_id"]) for index, doc in enumerate(docs) if index not in failed]
+            errors = [{"index": error["index"], "errmsg": error.get("errmsg", "")} for error in write_errors]
+            return inserted_ids, errors
+        return [str(inserted_id) for inserted_id in result.inserted_ids], []
+
+    async def _insert_raw(self, doc: dict) -> ObjectId:
+        """Insert an already validated document and return its ID."""
+        result = await self.collection.insert_one(doc)
+        return result.inserted_id
 
     async def get_sentra_core_by_id(self, sentra_core_id: str) -> Optional[SentraCoreModel]:
         """Get a SentraCore configuration by ID."""
-        try:
-            if not ObjectId.is_valid(sentra_core_id):
-                raise ValueError("Invalid ObjectId format")
-                
-            doc = await self.collection.find_one({"_id": ObjectId(sentra_core_id)})
-            if doc:
-                return SentraCoreModel(**doc)
-            return None
-            
-        except Exception as e:
-            raise Exception(f"Error retrieving SentraCore configuration: {str(e)}")
+        oid = _parse_oid(sentra_core_id)
+        
+        doc = await self._find_batched(oid)
+        if doc:
+            return _from_doc(SentraCoreModel, doc)
+        return None
+
+    async def _find_batched(self, oid: ObjectId) -> Optional[dict]:
+        """Queue a read by _id; reads queued within READ_BATCH_WINDOW share one $in query."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending_reads.setdefault(oid, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_reads())
+            self._flush_task.add_done_callback(self._release_unflushed)
+        return await future
 
-    async def get_all_sentra_core(self, skip: int = 0, limit: int = 100) -> List[SentraCoreModel]:
-        """Get all SentraCore configurations with pagination."""
+    def _release_unflushed(self, task: asyncio.Task):
+        """Clean up after a flush task that was cancelled before it started running."""
+        # A flush that ran has already cleared _flush_task in its finally block
+        if self._flush_task is not task:
+            return
+        self._flush_task = None
+        pending, self._pending_reads = self._pending_reads, {}
+        for futures in pending.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+    async def _flush_reads(self):
+        """Run the batched $in query and resolve every waiting future."""
+        pending = None
         try:
-            cursor = self.collection.find().skip(skip).limit(limit).sort("created_at", -1)
-            documents = await cursor.to_list(length=limit)
-            return [SentraCoreModel(**doc) for doc in documents]
+            await asyncio.sleep(READ_BATCH_WINDOW)
+            pending, self._pending_reads = self._pending_reads, {}
+            # Reads queued while the query runs start the next batch
+            self._flush_task = None
+            
+            cursor = self.collection.find({"_id": {"$in": list(pending)}}, batch_size=len(pending))
+            docs = {doc["_id"]: doc async for doc in cursor}
             
+            for oid, futures in pending.items():
+                for future in futures:
+                    # Waiters may have been cancelled (e.g. client disconnected)
+                    if not future.done():
+                        future.set_result(docs.get(oid))
         except Exception as e:
-            raise Exception(f"Error retrieving SentraCore configurations: {str(e)}")
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            # Never leave the batcher pointing at a finished task, or later reads would hang
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+            if pending is None:
+                # Cancelled during the window: release the reads queued so far
+                pending, self._pending_reads = self._pending_reads, {}
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+
+    async def get_all_sentra_core(self, limit: int = 100, after_id: Optional[str] = None) -> List[dict]:
+        """Get all SentraCore configurations, newest first, paginated by _id."""
+        # Range on _id instead of skip so deep pages stay cheap
+        query = {"_id": {"$lt": _parse_oid(after_id)}} if after_id else {}
+        
+        # Match the wire batch to the page size so a page is one round-trip;
+        # aggregate passes hint through unconverted, so refer to the index by name
+        cursor = self.collection.aggregate([
+            {"$match": query},
+            {"$sort": {"_id": -1}},
+            {"$limit": limit},
+            LIST_PROJECT_STAGE
+        ], batchSize=limit, hint=LIST_INDEX_NAME)
+        return [doc async for doc in cursor]
 
     async def update_sentra_core(self, sentra_core_id: str, update_data: SentraCoreUpdate) -> Optional[SentraCoreModel]:
         """Update a SentraCore configuration."""
-        try:
-            if not ObjectId.is_valid(sentra_core_id):
-                raise ValueError("Invalid ObjectId format")
-            
-            # Prepare update data
-            update_dict = update_data.model_dump(exclude_unset=True)
-            update_dict["updated_at"] = datetime.utcnow()
-            
-            # Update the document
-            result = await self.collection.update_one(
-                {"_id": ObjectId(sentra_core_id)},
-                {"$set": update_dict}
-            )
-            
-            if result.modified_count:
-                # Return the updated document
-                updated_doc = await self.collection.find_one({"_id": ObjectId(sentra_core_id)})
-                return SentraCoreModel(**updated_doc)
+        oid = _parse_oid(sentra_core_id)
+        
+        # Prepare update data
+        update_dict = update_data.model_dump(exclude_unset=True)
+        update_dict["updated_at"] = datetime.utcnow()
+        
+        # Update the document and get it back in one atomic round-trip;
+        # a missing document yields None rather than being created
+        updated_doc = await self.collection.find_one_and_update(
+            {"_id": oid},
+            {"$set": update_dict},
+            upsert=False,
+            return_document=ReturnDocument.AFTER
+        )
+        
+        if updated_doc is None:
             return None
-            
-        except Exception as e:
-            raise Exception(f"Error updating SentraCore configuration: {str(e)}")
+        return _from_doc(SentraCoreModel, updated_doc)
 
     async def delete_sentra_core(self, sentra_core_id: str) -> bool:
         """Delete a SentraCore configuration."""
-        try:
-            if not ObjectId.is_valid(sentra_core_id):
-                raise ValueError("Invalid ObjectId format")
-                
-            result = await self.collection.delete_one({"_id": ObjectId(sentra_core_id)})
-            return result.deleted_count > 0
-            
-        except Exception as e:
-            raise Exception(f"Error deleting SentraCore configuration: {str(e)}")
+        oid = _parse_oid(sentra_core_id)
+        
+        result = await self.collection.delete_one({"_id": oid})
+        return result.deleted_count > 0
 
-    async def search_sentra_core_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[SentraCoreModel]:
+    async def search_sentra_core_by_name(self, name: str, skip: int = 0, limit: int = 100, prefix: bool = False) -> List[dict]:
         """Search SentraCore configurations by name."""
-        try:
-            cursor = self.collection.find(
-                {"name": {"$regex": name, "$options": "i"}}
-            ).skip(skip).limit(limit).sort("created_at", -1)
-            
-            documents = await cursor.to_list(length=limit)
-            return [SentraCoreModel(**doc) for doc in documents]
-            
-        except Exception as e:
-            raise Exception(f"Error searching SentraCore configurations: {str(e)}")
+        options = {"batchSize": limit}
+        if prefix:
+            # Case-insensitive prefix range served by the collated name index;
+            # _id breaks ties between equal names so skip-based pages are stable
+            match = _prefix_match(name)
+            sort = {"name": 1, "_id": 1}
+            options["collation"] = NAME_COLLATION
+        else:
+            match = {"$match": {"$text": {"$search": name}}}
+            # Equal names score equally, so _id keeps the order deterministic
+            sort = {"score": {"$meta": "textScore"}, "_id": -1}
+        
+        cursor = self.collection.aggregate([
+            match,
+            {"$sort": sort},
+            {"$skip": skip},
+            {"$limit": limit},
+            LIST_PROJECT_STAGE
+        ], **options)
+        return [doc async for doc in cursor]
 
     async def get_sentra_core_count(self) -> int:
         """Get total count of SentraCore configurations."""
-        try:
-            return await self.collection.count_documents({})
-        except Exception as e:
-            raise Exception(f"Error counting SentraCore configurations: {str(e)}")
+        # Reads collection metadata instead of scanning
+        return await self.collection.estimated_document_count()
 
     async def save_current_state(self, name: str, labels: List, connections: List, selected_option: str, description: str = "") -> SentraCoreModel:
         """Save the current state from the frontend."""
-        try:
-            # Convert frontend data format to our model format
-            converted_labels = []
-            for label in labels:
-                converted_labels.append({
-                    "id": label.id,
-                    "text": label.text,
-                    "value": label.value,
-                    "x": label.x,
-                    "y": label.y,
-                    "category": label.category
-                })
-            
-            converted_connections = []
-            for connection in connections:
-                converted_connections.append({
-                    "id": connection.id,
-                    "from_id": connection.from_id,  # Updated to use from_id
-                    "to_id": connection.to_id       # Updated to use to_id
-                })
-            
-            # Create the data
-            sentra_core_data = SentraCoreCreate(
-                name=name,
-                description=description,
-                labels=converted_labels,
-                connections=converted_connections,
-                selected_option=selected_option
-            )
-            # Save to database
-            return await self.create_sentra_core(sentra_core_data)
-            
-        except Exception as e:
-            raise Exception(f"Error saving current state: {str(e)}") 
\ No newline at end of file
+        now = datetime.utcnow()
+        # Frontend labels/connections already share the stored field names
+        doc = {
+            "name": name,
+            "description": description,
+            "labels": [label.model_dump() for label in labels],
+            "connections": [connection.model_dump() for connection in connections],
+            "selected_option": selected_option,
+            "created_at": now,
+            "updated_at": now
+        }
+        # The request body is already validated, so insert it as-is
+        doc["_id"] = await self._insert_raw(doc)
+        return _from_doc(SentraCoreModel, doc)
\ No newline at end of file
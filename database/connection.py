@@ -9,6 +9,20 @@ load_dotenv()
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "sentra_core_db")
 
+# Case-insensitive collation shared by the name index and name queries
+NAME_COLLATION = {"locale": "en", "strength": 2}
+
+# Compound index covering the list query: the _id sort/range key plus every listed field
+LIST_INDEX = [
+    ("_id", -1),
+    ("name", 1),
+    ("description", 1),
+    ("selected_option", 1),
+    ("created_at", -1),
+    ("updated_at", -1)
+]
+LIST_INDEX_NAME = "list_covering"
+
 # Async client for FastAPI
 async_client = None
 
@@ -23,11 +37,21 @@ async def connect_to_mongo():
         # Test the connection
         await async_client.admin.command('ping')
         print("Successfully connected to MongoDB!")
+        await create_indexes()
         return async_client
     except Exception as e:
         print(f"Error connecting to MongoDB: {e}")
         raise e
 
+async def create_indexes():
+    """Create the indexes used by the SentraCore queries."""
+    collection = async_client[DATABASE_NAME]["sentra_core"]
+    # Text index for name search, case-insensitive btree index for prefix search
+    await collection.create_index([("name", "text")])
+    await collection.create_index([("name", 1), ("_id", 1)], name="name_id_ci", collation=NAME_COLLATION)
+    # Lets the list query be answered from the index alone
+    await collection.create_index(LIST_INDEX, name=LIST_INDEX_NAME)
+
 async def close_mongo_connection():
     """Close database connection."""
     global async_client
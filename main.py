@@ -1,19 +1,49 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from routes.sentra_core_routes import router as sentra_core_router
 from database.connection import connect_to_mongo, close_mongo_connection
+from utils.responses import SentraCoreJSONResponse
 import uvicorn
 import os
 from pathlib import Path
 from contextlib import asynccontextmanager
+from functools import lru_cache
+
+# Path to the built Next.js frontend
+frontend_build_path = Path(__file__).parent.parent / "LIZREC" / ".next" / "server" / "app"
+
+# Built pages keyed by route ("index", "about", ...); skipped when DEV_NO_CACHE is set
+DEV_NO_CACHE = os.getenv("DEV_NO_CACHE", "").lower() in ("1", "true", "yes")
+_page_cache = {}
+
+@lru_cache(maxsize=2048)
+def _cached_exists(path: str) -> bool:
+    return Path(path).exists()
+
+def path_exists(path: Path) -> bool:
+    """Check a frontend file exists, memoized unless DEV_NO_CACHE is set."""
+    if DEV_NO_CACHE:
+        return path.exists()
+    return _cached_exists(str(path))
+
+def load_page_cache():
+    """Read the built HTML pages into memory; they don't change between deploys."""
+    _page_cache.clear()
+    if not frontend_build_path.exists():
+        return
+    for html_path in frontend_build_path.rglob("*.html"):
+        route = html_path.relative_to(frontend_build_path).with_suffix("").as_posix()
+        _page_cache[route] = html_path.read_bytes()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     # Startup
     await connect_to_mongo()
+    if not DEV_NO_CACHE:
+        load_page_cache()
     yield
     # Shutdown
     await close_mongo_connection()
@@ -23,6 +53,7 @@ app = FastAPI(
     title="SentraCore API",
     description="API for managing SentraCore robot configurations",
     version="1.0.0",
+    default_response_class=SentraCoreJSONResponse,
     lifespan=lifespan
 )
 
@@ -66,7 +97,7 @@ async def handle_next_image(request: Request):
     if url.startswith("/images/"):
         # Remove the leading slash and serve from public directory
         image_path = frontend_public_path / url[1:]  # Remove leading slash
-        if image_path.exists():
+        if path_exists(image_path):
             return FileResponse(str(image_path))
     
     return {"error": "Image not found"}
@@ -84,26 +115,29 @@ async def serve_frontend(request: Request, full_path: str):
         full_path in ["favicon.ico", "favicon.png", "favicon.svg"]):
         return {"error": "Static asset not found"}
     
-    # Path to the built Next.js frontend
-    frontend_build_path = Path(__file__).parent.parent / "LIZREC" / ".next" / "server" / "app"
-    
     # Clean the path and remove leading slash
     clean_path = full_path.strip("/")
     
+    # Serve from memory when the pages were cached at startup
+    if _page_cache:
+        body = _page_cache.get(clean_path or "index") or _page_cache.get("index")
+        if body:
+            return Response(content=body, media_type="text/html")
+    
     # If it's the root path, serve index.html
     if not clean_path:
         index_path = frontend_build_path / "index.html"
-        if index_path.exists():
+        if path_exists(index_path):
             return FileResponse(str(index_path))
     
     # Try to serve the specific page
     page_path = frontend_build_path / f"{clean_path}.html"
-    if page_path.exists():
+    if path_exists(page_path):
         return FileResponse(str(page_path))
     
     # If not found, serve the main page (for client-side routing)
     main_page_path = frontend_build_path / "index.html"
-    if main_page_path.exists():
+    if path_exists(main_page_path):
         return FileResponse(str(main_page_path))
     
     # If no frontend files found, return a simple message
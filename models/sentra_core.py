@@ -20,7 +20,6 @@ class SentraCoreModel(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
         arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str},
         json_schema_extra={
             "example": {
                 "name": "Robot Movement Sequence",
@@ -64,6 +63,19 @@ class SentraCoreModel(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
 
+class SentraCoreListItem(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True
+    )
+    
+    id: Optional[Union[str, ObjectId]] = Field(default=None, alias="_id")
+    name: str = Field(..., description="Name of the SentraCore configuration")
+    description: Optional[str] = Field(default="", description="Description of the configuration")
+    selected_option: Optional[str] = Field(default="", description="Currently selected action option")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
 class SentraCoreCreate(BaseModel):
     name: str
     description: Optional[str] = ""
@@ -1,14 +1,34 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Body
 from typing import List, Optional
-from models.sentra_core import SentraCoreModel, SentraCoreCreate, SentraCoreUpdate, LabelModel, ConnectionModel
+from models.sentra_core import SentraCoreModel, SentraCoreListItem, SentraCoreCreate, SentraCoreUpdate, LabelModel, ConnectionModel
 from controllers.sentra_core_controller import SentraCoreController
-from pydantic import BaseModel, Field
+from utils.responses import SentraCoreJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from pymongo.errors import PyMongoError
 
 router = APIRouter(prefix="/api/sentra-core", tags=["SentraCore"])
 
+# Shared controller instance, created on first use
+_controller = None
+
 # Dependency to get controller instance
 def get_controller():
-    return SentraCoreController()
+    global _controller
+    if not _controller:
+        _controller = SentraCoreController()
+    return _controller
+
+# Largest number of configurations accepted by a single bulk request
+BULK_MAX_ITEMS = 1000
+
+# Built once at import so item routes serialize without per-request schema work
+_item_ta = TypeAdapter(SentraCoreModel)
+
+def item_response(item: SentraCoreModel, status_code: int = 200) -> SentraCoreJSONResponse:
+    """Serialize a SentraCoreModel straight into a response, bypassing response_model."""
+    # Read paths build models with model_construct, so nested items may still be dicts
+    content = _item_ta.dump_python(item, by_alias=True, warnings=False)
+    return SentraCoreJSONResponse(content, status_code=status_code)
 
 # Request model for saving current state
 class FrontendLabel(BaseModel):
@@ -31,18 +51,45 @@ class SaveStateRequest(BaseModel):
     connections: List[FrontendConnection]
     selected_option: str
 
-@router.post("/", response_model=SentraCoreModel, status_code=201)
+@router.post(
+    "/",
+    response_model=None,
+    response_class=SentraCoreJSONResponse,
+    status_code=201,
+    responses={201: {"model": SentraCoreModel}}
+)
 async def create_sentra_core(
     sentra_core_data: SentraCoreCreate,
     controller: SentraCoreController = Depends(get_controller)
 ):
     """Create a new SentraCore configuration."""
     try:
-        return await controller.create_sentra_core(sentra_core_data)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        sentra_core = await controller.create_sentra_core(sentra_core_data)
+        return item_response(sentra_core, status_code=201)
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+@router.post("/bulk/", status_code=201)
+async def bulk_create_sentra_core(
+    items: List[SentraCoreCreate] = Body(..., max_length=BULK_MAX_ITEMS),
+    controller: SentraCoreController = Depends(get_controller)
+):
+    """Create many SentraCore configurations at once."""
+    try:
+        inserted_ids, errors = await controller.bulk_create(items)
+        if errors:
+            # Partial success: tell the client which items were written and which failed
+            return SentraCoreJSONResponse({"inserted_ids": inserted_ids, "errors": errors}, status_code=207)
+        return {"inserted_ids": inserted_ids}
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-@router.get("/{sentra_core_id}", response_model=SentraCoreModel)
+@router.get(
+    "/{sentra_core_id}",
+    response_model=None,
+    response_class=SentraCoreJSONResponse,
+    responses={200: {"model": SentraCoreModel}}
+)
 async def get_sentra_core(
     sentra_core_id: str,
     controller: SentraCoreController = Depends(get_controller)
@@ -52,25 +99,39 @@ async def get_sentra_core(
         sentra_core = await controller.get_sentra_core_by_id(sentra_core_id)
         if not sentra_core:
             raise HTTPException(status_code=404, detail="SentraCore configuration not found")
-        return sentra_core
+        return item_response(sentra_core)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-@router.get("/", response_model=List[SentraCoreModel])
+# List rows are plain dicts from the controller; returning the response directly skips validation and encoding
+@router.get(
+    "/",
+    response_model=None,
+    response_class=SentraCoreJSONResponse,
+    responses={200: {"model": List[SentraCoreListItem]}}
+)
 async def get_all_sentra_core(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    after_id: Optional[str] = Query(None, description="Return records older than this ID (the last ID of the previous page)"),
     controller: SentraCoreController = Depends(get_controller)
 ):
-    """Get all SentraCore configurations with pagination."""
+    """Get all SentraCore configurations with cursor pagination."""
     try:
-        return await controller.get_all_sentra_core(skip=skip, limit=limit)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        rows = await controller.get_all_sentra_core(limit=limit, after_id=after_id)
+        return SentraCoreJSONResponse(rows)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-@router.put("/{sentra_core_id}", response_model=SentraCoreModel)
+@router.put(
+    "/{sentra_core_id}",
+    response_model=None,
+    response_class=SentraCoreJSONResponse,
+    responses={200: {"model": SentraCoreModel}}
+)
 async def update_sentra_core(
     sentra_core_id: str,
     update_data: SentraCoreUpdate,
@@ -81,11 +142,11 @@ async def update_sentra_core(
         updated_sentra_core = await controller.update_sentra_core(sentra_core_id, update_data)
         if not updated_sentra_core:
             raise HTTPException(status_code=404, detail="SentraCore configuration not found")
-        return updated_sentra_core
+        return item_response(updated_sentra_core)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 @router.delete("/{sentra_core_id}")
 async def delete_sentra_core(
@@ -99,22 +160,29 @@ async def delete_sentra_core(
             raise HTTPException(status_code=404, detail="SentraCore configuration not found")
         return {"message": "SentraCore configuration deleted successfully"}
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-@router.get("/search/", response_model=List[SentraCoreModel])
+@router.get(
+    "/search/",
+    response_model=None,
+    response_class=SentraCoreJSONResponse,
+    responses={200: {"model": List[SentraCoreListItem]}}
+)
 async def search_sentra_core(
     name: str = Query(..., description="Name to search for"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    prefix: bool = Query(False, description="Match names starting with the search term (case-insensitive) instead of full-text search"),
     controller: SentraCoreController = Depends(get_controller)
 ):
     """Search SentraCore configurations by name."""
     try:
-        return await controller.search_sentra_core_by_name(name, skip=skip, limit=limit)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        rows = await controller.search_sentra_core_by_name(name, skip=skip, limit=limit, prefix=prefix)
+        return SentraCoreJSONResponse(rows)
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 @router.get("/count/")
 async def get_sentra_core_count(
@@ -124,22 +192,29 @@ async def get_sentra_core_count(
     try:
         count = await controller.get_sentra_core_count()
         return {"count": count}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-@router.post("/save-state/", response_model=SentraCoreModel, status_code=201)
+@router.post(
+    "/save-state/",
+    response_model=None,
+    response_class=SentraCoreJSONResponse,
+    status_code=201,
+    responses={201: {"model": SentraCoreModel}}
+)
 async def save_current_state(
     request: SaveStateRequest,
     controller: SentraCoreController = Depends(get_controller)
 ):
     """Save the current state from the frontend."""
     try:
-        return await controller.save_current_state(
+        sentra_core = await controller.save_current_state(
             name=request.name,
             labels=request.labels,
             connections=request.connections,
             selected_option=request.selected_option,
             description=request.description
         )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+        return item_response(sentra_core, status_code=201)
+    except PyMongoError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e 
\ No newline at end of file
@@ -0,0 +1,15 @@
+import orjson
+from bson import ObjectId
+from fastapi.responses import ORJSONResponse
+
+def _default(obj):
+    """Serialize ObjectId as its hex string; any other unknown type is an error."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class SentraCoreJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes ObjectId values as strings."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default)
\ No newline at end of file